@@ -23,10 +23,13 @@ def basic_generation_example():
     model = setup_gemini()
     
     prompt = "Explain what an AI agent is in simple terms"
-    response = model.generate_content(prompt)
-    
     print("Prompt:", prompt)
-    print("\nResponse:", response.text)
+    print("\nResponse: ", end="", flush=True)
+    
+    # Stream the reply so text shows up as soon as the first tokens arrive
+    for chunk in model.generate_content(prompt, stream=True):
+        print(chunk.text, end="", flush=True)
+    print()
 
 def conversation_example():
     """Example of having a conversation with Gemini."""
@@ -43,8 +46,10 @@ def conversation_example():
     
     for message in messages:
         print(f"\nYou: {message}")
-        response = chat.send_message(message)
-        print(f"Gemini: {response.text}")
+        print("Gemini: ", end="", flush=True)
+        for chunk in chat.send_message(message, stream=True):
+            print(chunk.text, end="", flush=True)
+        print()
 
 def main():
     """Run all the basic Gemini examples."""
@@ -4,22 +4,38 @@ This example shows how DSPy can help structure and optimize your prompts.
 """
 
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 import dspy
 
+# DSPy's on-disk LM response cache, shared by every example in this project
+DSPY_CACHE_DIR = Path(__file__).resolve().parent.parent / ".dspy_cache"
+
+# Built on the first setup_dspy() call; later calls just reuse it
+_LM_SINGLETON = None
+
 def setup_dspy():
     """Initialize DSPy with Gemini as the language model."""
-    load_dotenv()
-    
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
+    global _LM_SINGLETON
+    if _LM_SINGLETON is None:
+        load_dotenv()
+        
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+        
+        # Keep LM responses on disk so re-running a demo replays from the cache.
+        dspy.configure_cache(
+            enable_disk_cache=True,
+            disk_cache_dir=str(DSPY_CACHE_DIR),
+            disk_size_limit_bytes=10 * 1024**3,
+        )
+        _LM_SINGLETON = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
     
     # Configure DSPy to use Gemini via LiteLLM
-    gemini_lm = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
-    dspy.settings.configure(lm=gemini_lm)
+    dspy.settings.configure(lm=_LM_SINGLETON)
     
-    return gemini_lm
+    return _LM_SINGLETON
 
 class BasicQA(dspy.Signature):
     """Answer questions about AI agents clearly and concisely."""
@@ -44,10 +60,16 @@ def basic_dspy_example():
         "What are some real-world applications of AI agents?"
     ]
     
-    for question in questions:
-        result = qa(question=question)
+    # The questions are independent, so answer them all in parallel
+    examples = [dspy.Example(question=q).with_inputs("question") for q in questions]
+    results = qa.batch(examples, num_threads=len(examples), disable_progress_bar=True)
+    
+    for question, result in zip(questions, results):
         print(f"Q: {question}")
-        print(f"A: {result.answer}\n")
+        if result is None:
+            print("⚠️  Request failed, see the error log above\n")
+        else:
+            print(f"A: {result.answer}\n")
 
 def code_generation_example():
     """Show DSPy for code generation tasks."""
@@ -61,11 +83,16 @@ def code_generation_example():
         "A function that finds the most common word in a text string"
     ]
     
-    for desc in descriptions:
-        result = code_gen(description=desc)
+    examples = [dspy.Example(description=d).with_inputs("description") for d in descriptions]
+    results = code_gen.batch(examples, num_threads=len(examples), disable_progress_bar=True)
+    
+    for desc, result in zip(descriptions, results):
         print(f"Description: {desc}")
-        print("Generated Code:")
-        print(result.code)
+        if result is None:
+            print("⚠️  Request failed, see the error log above")
+        else:
+            print("Generated Code:")
+            print(result.code)
         print("-" * 50)
 
 class ChainOfThought(dspy.Signature):
@@ -7,55 +7,385 @@ import os
 from dotenv import load_dotenv
 import dspy
 import json
-from datetime import datetime, timedelta
+import hashlib
+import re
+import ast
+import functools
+import math
+import operator
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+
+# Cached predictor responses survive between runs so demo replays are free
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".agent_cache.sqlite"
+
+# DSPy's on-disk LM response cache, shared by every example in this project
+DSPY_CACHE_DIR = Path(__file__).resolve().parent.parent / ".dspy_cache"
+
+# Reminders created in interactive mode are kept here between sessions
+REMINDERS_PATH = Path(__file__).resolve().parent.parent / ".reminders.json"
+
+# Follow-up question the interactive agent answers ahead of time
+FOLLOW_UP = "Tell me more about: {}"
+
+# What process_request says it did, by task type
+_STATUS = {
+    "calculation": "🧮 Performing calculation...",
+    "reminder": "⏰ Creating reminder...",
+    "weather": "🌤️ Checking weather...",
+}
+
+# Read .env once at import instead of on every setup_dspy() call
+load_dotenv()
+
+# Shared LM so repeated setup_dspy() calls don't rebuild it
+_LM_SINGLETON = None
+_LM_LOCK = threading.Lock()
+
+def get_lm():
+    """Create the shared Gemini LM on first use; safe to call from any thread."""
+    global _LM_SINGLETON
+    with _LM_LOCK:
+        if _LM_SINGLETON is not None:
+            return _LM_SINGLETON
+        
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+        
+        # Keep LM responses on disk so re-running a demo replays from the cache.
+        dspy.configure_cache(
+            enable_disk_cache=True,
+            disk_cache_dir=str(DSPY_CACHE_DIR),
+            disk_size_limit_bytes=10 * 1024**3,
+        )
+        
+        _LM_SINGLETON = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
+        return _LM_SINGLETON
 
 def setup_dspy():
     """Initialize DSPy with Gemini as the language model."""
-    load_dotenv()
-    
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-    
-    # Configure DSPy to use Gemini via LiteLLM
-    gemini_lm = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
+    # Configure DSPy to use Gemini via LiteLLM. This stays out of get_lm()
+    # because DSPy only lets one thread change its settings.
+    gemini_lm = get_lm()
     dspy.settings.configure(lm=gemini_lm)
     
     return gemini_lm
 
-class TaskAnalyzer(dspy.Signature):
-    """Analyze a user request and determine what action to take."""
+_ENCODER_LOCK = threading.Lock()
+
+@functools.cache
+def _encoder():
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    return SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+
+def _load_encoder():
+    """Load the sentence embedding model used for semantic cache hits once, if installed."""
+    with _ENCODER_LOCK:
+        return _encoder()
+
+def _warmup():
+    """Load the encoder and open the Gemini connection before the first request needs them."""
+    _load_encoder()
+    try:
+        get_lm()("Reply with OK.", max_tokens=16, cache=False)
+    except Exception:
+        # Best effort only: the first real request reports any problem
+        pass
+
+if os.getenv("GEMINI_API_KEY"):
+    threading.Thread(target=_warmup, daemon=True).start()
+
+class LLMCache:
+    """A two-tier cache for DSPy predictor calls, persisted to SQLite.
+
+    Exact hits are looked up by a SHA-256 hash of the normalized inputs, the
+    predictor's signature (instructions and fields) and the LM model, so
+    editing a prompt or switching models never serves stale answers. When
+    sentence-transformers is installed, predictors wrapped with semantic=True
+    also reuse the response of the nearest previous request whose embedding
+    is above the cosine-similarity threshold.
+    
+    Entries older than max_age_days, or beyond the newest max_entries, are
+    dropped when the cache is opened.
+    """
+
+    def __init__(self, path=None, threshold=0.92, max_entries=5_000, max_age_days=30):
+        self.threshold = threshold
+        self.encoder = _load_encoder()
+        self._exact: dict[str, dict] = {}
+        self._vectors: dict[str, list[tuple["np.ndarray", str]]] = {}
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path or CACHE_PATH, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, namespace TEXT, outputs TEXT, embedding BLOB, created_at REAL)"
+        )
+        self._db.execute(
+            "DELETE FROM responses WHERE created_at < ?", (time.time() - max_age_days * 86_400,)
+        )
+        self._db.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY created_at DESC LIMIT ?)",
+            (max_entries,),
+        )
+        self._db.commit()
+        rows = self._db.execute("SELECT key, namespace, outputs, embedding FROM responses")
+        for key, namespace, outputs, embedding in rows:
+            self._exact[key] = json.loads(outputs)
+            # Embeddings are only useful (and numpy only needed) with an encoder
+            if embedding is not None and self.encoder is not None:
+                import numpy as np
+                vector = np.frombuffer(embedding, dtype=np.float32)
+                self._vectors.setdefault(namespace, []).append((vector, key))
+
+    def close(self):
+        """Close the SQLite connection; later results are only kept in memory."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @staticmethod
+    def _fingerprint(signature):
+        """Hash everything about a signature that ends up in the prompt."""
+        fields = [
+            (name, field.json_schema_extra.get("__dspy_field_type"), field.json_schema_extra.get("desc"))
+            for name, field in signature.fields.items()
+        ]
+        text = json.dumps([signature.instructions, fields], default=str)
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _normalize(kwargs):
+        """Build the cache text for a call: lowercased, whitespace-collapsed inputs."""
+        normalized = {k: " ".join(str(v).lower().split()) for k, v in kwargs.items()}
+        return json.dumps(normalized, sort_keys=True)
+
+    def _embed(self, text):
+        import numpy as np
+        return self.encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def _nearest(self, namespace, vector):
+        """Return the key of the closest cached request above the threshold, if any."""
+        candidates = self._vectors.get(namespace)
+        if not candidates:
+            return None
+        import numpy as np
+        matrix = np.stack([v for v, _ in candidates])
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        return candidates[best][1] if scores[best] >= self.threshold else None
+
+    def _store(self, key, namespace, outputs, vector):
+        with self._lock:
+            self._exact[key] = outputs
+            if vector is not None:
+                self._vectors.setdefault(namespace, []).append((vector, key))
+            # A prefetch can finish after close(); its result is still served
+            # from memory, just not persisted
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, namespace, json.dumps(outputs),
+                 None if vector is None else vector.tobytes(), time.time()),
+            )
+            self._db.commit()
+
+    def wrap(self, name, predictor, semantic=False):
+        """Wrap a predictor so repeated (or, with semantic=True, paraphrased) calls skip the LM.
+        
+        The wrapper also has a prefetch(executor, **kwargs) method that starts a
+        call in the background; asking for the same inputs meanwhile waits for
+        that call instead of sending a second one.
+        """
+        fingerprint = self._fingerprint(predictor.signature)
+        
+        def make_key(kwargs):
+            # The model is read per call, since dspy.settings can change it
+            model = getattr(dspy.settings.lm, "model", None)
+            namespace = f"{name}:{fingerprint}:{model}"
+            text = self._normalize(kwargs)
+            return text, namespace, hashlib.sha256(f"{namespace}:{text}".encode()).hexdigest()
+        
+        def compute(key, namespace, vector, kwargs):
+            result = predictor(**kwargs)
+            self._store(key, namespace, result.toDict(), vector)
+            return result
+        
+        def cached_predictor(**kwargs):
+            text, namespace, key = make_key(kwargs)
+            # In-flight calls are checked first: they store their result
+            # before leaving _pending, so one of the two lookups always sees it
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending.result()
+            if key in self._exact:
+                return dspy.Prediction(**self._exact[key])
+
+            vector = None
+            if semantic and self.encoder is not None:
+                vector = self._embed(text)
+                neighbour = self._nearest(namespace, vector)
+                if neighbour is not None:
+                    return dspy.Prediction(**self._exact[neighbour])
+
+            return compute(key, namespace, vector, kwargs)
+        
+        def prefetch(executor, **kwargs):
+            text, namespace, key = make_key(kwargs)
+            with self._lock:
+                if key in self._exact or key in self._pending:
+                    return
+                vector = self._embed(text) if semantic and self.encoder is not None else None
+                future = executor.submit(compute, key, namespace, vector, kwargs)
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._forget(key))
+        
+        cached_predictor.prefetch = prefetch
+        return cached_predictor
+    
+    def _forget(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+# Keyword rules for requests whose task type is obvious, checked in order.
+# Anything they don't match is classified by the unified LM call.
+_LOCAL_ROUTER = [
+    (re.compile(r"\b(calculate|compute|sqrt|square root|multipl(y|ied)|divided?|plus|minus|times"
+                r"|power of|squared)\b|\d\s*[-+*/^]\s*[-+]?\s*\d", re.I), "calculation"),
+    (re.compile(r"\b(remind|reminder)\b", re.I), "reminder"),
+    # Only forecast requests ("what's the weather like today?") count as weather;
+    # "how does weather forecasting work?" is a question for the LM
+    (re.compile(r"\bweather\b.*\b(like|today|tonight|tomorrow|now|this (morning|afternoon|evening|week|weekend))\b"
+                r"|\b(forecast for|going to (rain|snow))\b", re.I), "weather"),
+    (re.compile(r"\b(who|what|when|where|why|how)\b", re.I), "question"),
+]
+
+def route_locally(user_request):
+    """Return the task type for an obvious request, or None if the LM should decide."""
+    for pattern, task_type in _LOCAL_ROUTER:
+        if pattern.search(user_request):
+            return task_type
+    return None
+
+# Spoken arithmetic rewritten into Python syntax before local evaluation
+_MATH_PHRASES = [
+    (re.compile(r"square root of\s*(\d+(?:\.\d+)?)"), r"sqrt(\1)"),
+    (re.compile(r"to the power of|\^"), "**"),
+    (re.compile(r"\bsquared\b"), "**2"),
+    (re.compile(r"multiplied by|\btimes\b"), "*"),
+    (re.compile(r"divided by"), "/"),
+    (re.compile(r"\bplus\b"), "+"),
+    (re.compile(r"\bminus\b"), "-"),
+]
+# Three numbers joined by the same separator read as a date ("2024-1-5"), not a sum
+_DATE_LIKE = re.compile(r"\b\d{1,4}([-/.])\d{1,2}\1\d{1,4}\b")
+# Longer input is left to the LM; ast.parse recurses once per chained operator
+_MAX_EXPRESSION_LENGTH = 200
+_MATH_FILLER = re.compile(r"\b(what's|what|is|calculate|compute|evaluate|the|value|result|of|please)\b|[?!,]")
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+def _eval_node(node):
+    """Evaluate a parsed expression that only uses numbers, arithmetic and sqrt()."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        left, right = _eval_node(node.left), _eval_node(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > 100:
+            raise ValueError("Exponent too large to evaluate locally")
+        return _OPERATORS[type(node.op)](left, right)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id == "sqrt" and len(node.args) == 1 and not node.keywords):
+        return math.sqrt(_eval_node(node.args[0]))
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+def _safe_eval(expression: str) -> str:
+    """Evaluate plain arithmetic like "15 multiplied by 23" without the LM.
+    
+    Raises ValueError (or SyntaxError/ArithmeticError) when the text is anything
+    more than numbers and operators, so the caller can fall back to the LM.
+    """
+    if len(expression) > _MAX_EXPRESSION_LENGTH or _DATE_LIKE.search(expression):
+        raise ValueError(f"Not a plain arithmetic expression: {expression}")
+    
+    text = expression.lower()
+    for pattern, replacement in _MATH_PHRASES:
+        text = pattern.sub(replacement, text)
+    text = _MATH_FILLER.sub(" ", text)
+    if re.search(r"[a-z]", text.replace("sqrt", "")):
+        raise ValueError(f"Not a plain arithmetic expression: {expression}")
+    
+    tree = ast.parse(text.strip(), mode="eval")
+    # A lone number ("5", "-3") has nothing to calculate
+    if not isinstance(tree.body, (ast.BinOp, ast.Call)):
+        raise ValueError(f"Nothing to calculate in: {expression}")
+    value = _eval_node(tree.body)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return f"{ast.unparse(tree)} = {value}"
+
+class UnifiedAgent(dspy.Signature):
+    """Classify and complete the user's request."""
     user_request = dspy.InputField()
-    task_type = dspy.OutputField(desc="One of: reminder, calculation, question, weather, unknown")
-    extracted_info = dspy.OutputField(desc="Key information needed to complete the task")
-
-class Calculator(dspy.Signature):
-    """Perform mathematical calculations."""
-    expression = dspy.InputField(desc="Mathematical expression to calculate")
-    result = dspy.OutputField(desc="The calculated result with explanation")
-
-class QuestionAnswerer(dspy.Signature):
-    """Answer general knowledge questions."""
-    question = dspy.InputField()
-    answer = dspy.OutputField(desc="Informative and accurate answer")
-
-class ReminderCreator(dspy.Signature):
-    """Create reminders from natural language."""
-    request = dspy.InputField(desc="Natural language reminder request")
-    reminder_text = dspy.OutputField(desc="Clear reminder message")
-    suggested_time = dspy.OutputField(desc="Suggested reminder time based on context")
-
-class SimpleAgent:
+    task_type = dspy.OutputField(desc="reminder, calculation, question, weather or unknown")
+    result = dspy.OutputField(desc="Final user-facing response")
+    reminder_text = dspy.OutputField(desc="Reminder message; empty unless a reminder")
+    suggested_time = dspy.OutputField(desc="Reminder time from context; empty unless a reminder")
+
+class SimpleAgent(dspy.Module):
     """A simple AI agent that can handle multiple types of tasks."""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, reminders_path=None, prefetch=False):
+        super().__init__()
         setup_dspy()
         self.verbose = verbose
-        self.task_analyzer = dspy.Predict(TaskAnalyzer)
-        self.calculator = dspy.Predict(Calculator)
-        self.qa = dspy.Predict(QuestionAnswerer)
-        self.reminder_creator = dspy.Predict(ReminderCreator)
-        self.reminders = []  # Simple in-memory storage
+        self.cache = LLMCache()
+        
+        # One predictor classifies and handles the request in a single LM call.
+        # Only number-free questions use semantic hits: paraphrases of "15 * 23"
+        # or "remind me at 2 PM" must not reuse each other's results
+        unified = dspy.Predict(UnifiedAgent)
+        self.unified = self.cache.wrap("UnifiedAgent", unified)
+        self.unified_question = self.cache.wrap("UnifiedAgent", unified, semantic=True)
+        # Simple in-memory storage, bounded so long sessions can't grow it forever
+        self.reminders: deque[dict] = deque(maxlen=10_000)
+        self.reminders_path = reminders_path
+        if reminders_path is not None and reminders_path.exists():
+            self._load_reminders()
+        
+        # Answers likely follow-ups while the user is still typing. Off by
+        # default: it spends an LM call that only pays off if someone asks
+        self.prefetcher = ThreadPoolExecutor(max_workers=2) if prefetch else None
+        self.follow_up = None
+    
+    def close(self):
+        """Stop the follow-up prefetcher and close the response cache."""
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown(wait=False, cancel_futures=True)
+        self.cache.close()
     
     def _show_prompt_and_response(self, stage, inputs, result):
         """Display the prompt and response for educational purposes."""
@@ -80,95 +410,136 @@ class SimpleAgent:
         
         print("─" * 40)
 
-    def process_request(self, user_request):
-        """Main method to process user requests."""
-        print(f"\n📨 Processing: '{user_request}'")
+    def forward(self, user_request):
+        """Handle a request locally when possible, otherwise with one unified LM call."""
+        # Plain arithmetic and the mock weather never need the LM. Arithmetic
+        # is tried first whatever the keyword rules say, since _safe_eval is
+        # the real test of whether a request is a calculation.
+        response = self._handle_calculation(user_request)
+        if response is not None:
+            return dspy.Prediction(task_type="calculation", response=response, reminder=None)
         
-        # First, analyze what type of task this is
-        analysis = self.task_analyzer(user_request=user_request)
+        task_type = route_locally(user_request)
+        if task_type == "weather":
+            return dspy.Prediction(task_type=task_type, response=self._handle_weather(user_request), reminder=None)
         
-        if self.verbose:
-            self._show_prompt_and_response("Task Analysis", {"user_request": user_request}, analysis)
+        # Everything else is classified and answered in a single call
+        result = self._unified_for(user_request, task_type)(user_request=user_request)
         
-        print(f"🔍 Task Type: {analysis.task_type}")
-        print(f"📋 Extracted Info: {analysis.extracted_info}")
+        if self.verbose:
+            self._show_prompt_and_response("Unified Agent", {"user_request": user_request}, result)
         
-        # Route to appropriate handler
-        if analysis.task_type == "calculation":
-            return self._handle_calculation(analysis.extracted_info)
-        elif analysis.task_type == "question":
-            return self._handle_question(user_request)
-        elif analysis.task_type == "reminder":
-            return self._handle_reminder(user_request)
-        elif analysis.task_type == "weather":
-            return self._handle_weather(user_request)
+        # Post-process by the task type the model chose. Reminders are only
+        # returned here; the caller stores them, so batches keep request order
+        reminder = None
+        if result.task_type == "calculation":
+            response = f"📊 Calculation Result: {result.result}"
+        elif result.task_type == "question":
+            response = f"💡 Answer: {result.result}"
+        elif result.task_type == "reminder":
+            response, reminder = self._handle_reminder(result)
+        elif result.task_type == "weather":
+            response = self._handle_weather(user_request)
         else:
-            return self._handle_unknown(user_request)
-    
-    def _handle_calculation(self, expression):
-        """Handle mathematical calculations."""
-        print("🧮 Performing calculation...")
-        result = self.calculator(expression=expression)
-        
-        if self.verbose:
-            self._show_prompt_and_response("Calculation", {"expression": expression}, result)
+            response = f"🤷 I'm not sure exactly what you need, but here's my best attempt to help: {result.result}"
         
-        return f"📊 Calculation Result: {result.result}"
+        return dspy.Prediction(task_type=result.task_type, response=response, reminder=reminder)
     
-    def _handle_question(self, question):
-        """Handle general knowledge questions."""
-        print("❓ Answering question...")
-        result = self.qa(question=question)
-        
-        if self.verbose:
-            self._show_prompt_and_response("Question Answering", {"question": question}, result)
-        
-        return f"💡 Answer: {result.answer}"
+    def _unified_for(self, user_request, task_type):
+        """Pick the cached unified predictor, allowing semantic hits only where they're safe."""
+        # Requests with numbers in them never use semantic hits: "6 squared"
+        # and "5 squared" embed almost identically but need different answers
+        if task_type == "question" and not re.search(r"\d", user_request):
+            return self.unified_question
+        return self.unified
+    
+    def process_request(self, user_request):
+        """Main method to process user requests."""
+        print(f"\n📨 Processing: '{user_request}'")
+        result = self(user_request=user_request)
+        if result.task_type in _STATUS:
+            print(_STATUS[result.task_type])
+        print(f"🔍 Task Type: {result.task_type}")
+        if result.reminder is not None:
+            self.add_reminder(result.reminder)
+        self._prefetch_follow_up(user_request, result.task_type)
+        return result.response
+    
+    def _prefetch_follow_up(self, user_request, task_type):
+        """Start answering "tell me more" for a question before the user asks."""
+        if task_type != "question":
+            self.follow_up = None
+            return
+        self.follow_up = FOLLOW_UP.format(user_request)
+        if self.prefetcher is None:
+            return
+        predictor = self._unified_for(self.follow_up, route_locally(self.follow_up))
+        predictor.prefetch(self.prefetcher, user_request=self.follow_up)
     
-    def _handle_reminder(self, request):
-        """Handle reminder creation."""
-        print("⏰ Creating reminder...")
-        result = self.reminder_creator(request=request)
+    def _handle_calculation(self, expression):
+        """Evaluate plain arithmetic locally, or return None if the LM is needed."""
+        try:
+            local_result = _safe_eval(expression)
+        except (SyntaxError, ValueError, ArithmeticError, RecursionError):
+            return None
         
         if self.verbose:
-            self._show_prompt_and_response("Reminder Creation", {"request": request}, result)
-        
-        # Store the reminder (in a real app, you'd use a database)
+            print(f"\n🔧 [Calculation] Evaluated locally: {local_result} (no LM call)")
+        return f"📊 Calculation Result: {local_result}"
+    
+    def _handle_reminder(self, result):
+        """Build the reminder the model extracted; add_reminder() stores it."""
         reminder = {
             "text": result.reminder_text,
             "suggested_time": result.suggested_time,
-            "created_at": datetime.now().isoformat()
+            "created_at": datetime.now()
         }
-        self.reminders.append(reminder)
         
-        return f"✅ Reminder created: {result.reminder_text}\n⏱️  Suggested time: {result.suggested_time}"
+        return f"✅ Reminder created: {result.reminder_text}\n⏱️  Suggested time: {result.suggested_time}", reminder
+    
+    def add_reminder(self, reminder):
+        """Store a reminder returned by forward()."""
+        # Store the reminder (in a real app, you'd use a database)
+        self.reminders.append(reminder)
+        if self.reminders_path is not None:
+            self._save_reminders()
+    
+    def _load_reminders(self):
+        """Load saved reminders, starting empty if the file can't be read."""
+        try:
+            reminders = json.loads(self.reminders_path.read_text())
+            for reminder in reminders:
+                reminder["created_at"] = datetime.fromisoformat(reminder["created_at"])
+        except (ValueError, KeyError, TypeError) as e:
+            # Keep the unreadable file so the next save can't overwrite it
+            bad_path = self.reminders_path.with_name(self.reminders_path.name + ".bad")
+            os.replace(self.reminders_path, bad_path)
+            print(f"⚠️  Couldn't read {self.reminders_path.name} ({e}), moved it to {bad_path.name}"
+                  " and starting with no reminders")
+            return
+        self.reminders.extend(reminders)
+    
+    def _save_reminders(self):
+        """Write all reminders out, replacing the file in one step."""
+        # Timestamps are only converted to text when they're written out.
+        # Writing a temp file first means a crash mid-write can't truncate the list
+        tmp_path = self.reminders_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(list(self.reminders), default=datetime.isoformat))
+        os.replace(tmp_path, self.reminders_path)
     
     def _handle_weather(self, request):
         """Handle weather requests (mock implementation)."""
-        print("🌤️ Checking weather...")
         return "🌤️ Weather: I don't have access to real weather data yet, but I can help you set up a weather API integration!"
     
-    def _handle_unknown(self, request):
-        """Handle unknown request types."""
-        print("🤔 Handling unknown request...")
-        fallback_question = f"How can I help with this request: {request}"
-        fallback = self.qa(question=fallback_question)
-        
-        if self.verbose:
-            self._show_prompt_and_response("Unknown Request Fallback", {"question": fallback_question}, fallback)
-        
-        return f"🤷 I'm not sure exactly what you need, but here's my best attempt to help: {fallback.answer}"
-    
     def list_reminders(self):
         """List all stored reminders."""
         if not self.reminders:
             return "📝 No reminders stored yet."
         
-        reminder_list = "📝 Your reminders:\n"
-        for i, reminder in enumerate(self.reminders, 1):
-            reminder_list += f"{i}. {reminder['text']} (suggested: {reminder['suggested_time']})\n"
-        
-        return reminder_list
+        return "📝 Your reminders:\n" + "".join(
+            f"{i}. {reminder['text']} (suggested: {reminder['suggested_time']})\n"
+            for i, reminder in enumerate(self.reminders, 1)
+        )
 
 def demo_agent(verbose=False):
     """Demonstrate the agent with various requests."""
@@ -193,26 +564,44 @@ def demo_agent(verbose=False):
         print("📚 Educational Mode: Showing prompts and responses")
         print("=" * 50)
     
-    for request in test_requests:
-        response = agent.process_request(request)
-        print(f"✨ Final Response: {response}")
-        print("-" * 50)
-        
+    try:
         if verbose:
-            input("⏸️  Press Enter to continue to next example...")
-            print()
-    
-    # Show all reminders
-    print("\n" + agent.list_reminders())
+            # Step through one request at a time so each prompt can be read
+            for request in test_requests:
+                response = agent.process_request(request)
+                print(f"✨ Final Response: {response}")
+                print("-" * 50)
+                input("⏸️  Press Enter to continue to next example...")
+                print()
+        else:
+            # Every request is I/O-bound on the Gemini API, so send them all at once
+            examples = [dspy.Example(user_request=r).with_inputs("user_request") for r in test_requests]
+            results = agent.batch(examples, num_threads=8, disable_progress_bar=True)
+            
+            for request, result in zip(test_requests, results):
+                print(f"\n📨 Request: '{request}'")
+                if result is None:
+                    print("⚠️  Request failed, see the error log above")
+                else:
+                    print(f"🔍 Task Type: {result.task_type}")
+                    print(f"✨ Final Response: {result.response}")
+                    if result.reminder is not None:
+                        agent.add_reminder(result.reminder)
+                print("-" * 50)
+        
+        # Show all reminders
+        print("\n" + agent.list_reminders())
+    finally:
+        agent.close()
 
 def interactive_mode(verbose=False):
     """Run the agent in interactive mode."""
-    agent = SimpleAgent(verbose=verbose)
+    agent = SimpleAgent(verbose=verbose, reminders_path=REMINDERS_PATH, prefetch=True)
     
     mode_text = "Interactive Mode (Verbose)" if verbose else "Interactive Mode"
     print(f"🤖 Simple AI Agent - {mode_text}")
     
-    commands = "Type 'quit' to exit, 'reminders' to see all reminders"
+    commands = "Type 'quit' to exit, 'reminders' to see all reminders, 'more' to follow up on an answer"
     if verbose:
         commands += ", 'toggle' to switch verbose mode"
     
@@ -223,21 +612,30 @@ def interactive_mode(verbose=False):
         print("📚 Educational Mode: Showing prompts and responses")
         print("=" * 50)
     
-    while True:
-        user_input = input("\n🎯 Your request: ").strip()
-        
-        if user_input.lower() == 'quit':
-            print("👋 Goodbye!")
-            break
-        elif user_input.lower() == 'reminders':
-            print(agent.list_reminders())
-        elif user_input.lower() == 'toggle' and verbose:
-            agent.verbose = not agent.verbose
-            status = "ON" if agent.verbose else "OFF"
-            print(f"🔧 Verbose mode toggled {status}")
-        elif user_input:
-            response = agent.process_request(user_input)
-            print(f"✨ Final Response: {response}")
+    try:
+        while True:
+            user_input = input("\n🎯 Your request: ").strip()
+            
+            if user_input.lower() == 'quit':
+                print("👋 Goodbye!")
+                break
+            elif user_input.lower() == 'reminders':
+                print(agent.list_reminders())
+            elif user_input.lower() == 'more':
+                if agent.follow_up is None:
+                    print("🤷 Ask a question first, then type 'more' to follow up on it.")
+                else:
+                    response = agent.process_request(agent.follow_up)
+                    print(f"✨ Final Response: {response}")
+            elif user_input.lower() == 'toggle' and verbose:
+                agent.verbose = not agent.verbose
+                status = "ON" if agent.verbose else "OFF"
+                print(f"🔧 Verbose mode toggled {status}")
+            elif user_input:
+                response = agent.process_request(user_input)
+                print(f"✨ Final Response: {response}")
+    finally:
+        agent.close()
 
 def main():
     """Choose between demo mode and interactive mode."""
@@ -1,23 +1,45 @@
+import asyncio
+import functools
 import os
-from datetime import datetime
+import threading
+import time
+from collections.abc import Mapping
+from datetime import date, datetime
+from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 import dspy
 
+# DSPy's on-disk LM response cache, shared by every example in this project
+DSPY_CACHE_DIR = Path(__file__).resolve().parent.parent / ".dspy_cache"
+
+# Built on the first setup_dspy() call; later calls just reuse it
+_LM_SINGLETON = None
+
 
 def setup_dspy():
     """Initialize DSPy with Gemini as the language model."""
-    load_dotenv()
-
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
+    global _LM_SINGLETON
+    if _LM_SINGLETON is None:
+        load_dotenv()
+
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+
+        # Keep LM responses on disk so re-running a demo replays from the cache.
+        dspy.configure_cache(
+            enable_disk_cache=True,
+            disk_cache_dir=str(DSPY_CACHE_DIR),
+            disk_size_limit_bytes=10 * 1024**3,
+        )
+        _LM_SINGLETON = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
 
     # Configure DSPy to use Gemini via LiteLLM
-    gemini_lm = dspy.LM(model="gemini/gemini-2.5-flash-lite", api_key=api_key)
-    dspy.settings.configure(lm=gemini_lm)
+    dspy.settings.configure(lm=_LM_SINGLETON, async_max_workers=16)
 
-    return gemini_lm
+    return _LM_SINGLETON
 
 
 class ReActAgentSignature(dspy.Signature):
@@ -27,44 +49,90 @@ class ReActAgentSignature(dspy.Signature):
     answer = dspy.OutputField(desc="Final answer based on the reasoning, no more than 2 sentences.")
 
 
+# Read-only so tools running in concurrent agents can share it safely
+_WEATHER: Mapping[str, str] = MappingProxyType(
+    {day: "rainy" for day in ("monday", "tuesday", "friday")}
+    | {day: "sunny" for day in ("wednesday", "thursday")}
+    | {day: "cloudy" for day in ("saturday", "sunday")}
+)
+
+
 def get_weather(city: str, day_of_week: str) -> str:
-    match day_of_week.lower():
-        case "monday" | "tuesday" | "friday":
-            weather = "rainy"
-        case "wednesday" | "thursday":
-            weather = "sunny"
-        case "saturday" | "sunday":
-            weather = "cloudy"
-        case _:
-            raise ValueError(f"Invalid day of week: {day_of_week}")
+    try:
+        weather = _WEATHER[day_of_week.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid day of week: {day_of_week}") from None
 
     print(f"get_weather({city}, {day_of_week}) -> {weather}")
     return f"The weather in {city} is {weather}."
 
 
+@functools.lru_cache(maxsize=2048)
+def _weekday_name(day: date) -> str:
+    return day.strftime("%A")
+
+
 def get_day_of_week(date_string: str) -> str:
-    date = datetime.fromisoformat(date_string)
-    day_of_week = date.strftime("%A")
-    print(f"get_day_of_week({date}) -> {day_of_week}")
+    parsed = datetime.fromisoformat(date_string)
+    day_of_week = _weekday_name(parsed.date())
+    print(f"get_day_of_week({parsed}) -> {day_of_week}")
     return day_of_week
 
 
+# Agents running concurrently have to take turns asking the user questions.
+# Answers depend on the user, so this tool must never be cached.
+_input_lock = threading.Lock()
+
+
 def ask_user_question(question: str) -> str:
-    return input(f"\nAgent: {question}\nYou: ")
+    with _input_lock:
+        return input(f"\nAgent: {question}\nYou: ")
+
 
+# DSPy 3.0.1's ReAct runs exactly one tool per step and has no hook for
+# dispatching tools itself, so independent lookups (e.g. the weather in two
+# cities) take one step each. Concurrency comes from running whole agents
+# side by side instead, as react_example does.
 
-def react_example():
+
+async def react_example():
     setup_dspy()
-    react = dspy.ReAct(
+    areact = dspy.asyncify(dspy.ReAct(
         signature=ReActAgentSignature,
         tools=[
             get_weather,
             get_day_of_week,
             ask_user_question
         ]
-    )
-    pred = react(question="Will I need a raincoat for Jame's birthday party?", today=datetime.now().isoformat())
-    print(pred.answer)
+    ))
+
+    today = date.today().isoformat()
+
+    # This one has to ask the user for the party date, so it runs on its own:
+    # other agents' tool traces would otherwise print over the prompt
+    question = "Will I need a raincoat for Jame's birthday party?"
+    pred = await areact(question=question, today=today)
+    print(f"\nQ: {question}")
+    print(f"A: {pred.answer}")
+
+    # These need no input, so they run side by side
+    questions = [
+        "What will the weather be like in Paris tomorrow?",
+        "Is it going to be sunny in Tokyo this Saturday?",
+        "Should I pack an umbrella for London on Friday?",
+    ]
+    start = time.perf_counter()
+    # One failed agent shouldn't throw away the other answers
+    preds = await asyncio.gather(*[areact(question=q, today=today) for q in questions], return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    for question, pred in zip(questions, preds):
+        print(f"\nQ: {question}")
+        if isinstance(pred, Exception):
+            print(f"⚠️  Failed: {pred}")
+        else:
+            print(f"A: {pred.answer}")
+    print(f"\n⏱️  Answered {len(questions)} questions in {elapsed:.2f}s")
 
 
 def interactive_mode():
@@ -79,8 +147,11 @@ def interactive_mode():
         ]
     )
     while (user_input := input("\n🎯 Your request: ").strip()).lower() != "quit":
-        pred = react(question=user_input, today=datetime.now().isoformat())
+        start = time.perf_counter()
+        pred = react(question=user_input, today=date.today().isoformat())
+        elapsed = time.perf_counter() - start
         print(f"Answer: {pred.answer}")
+        print(f"⏱️  {elapsed:.2f}s")
 
     print("👋 Goodbye!")
 
@@ -89,7 +160,7 @@ def main():
     """Run all the DSPy introduction examples."""
     match input("Hi! What would like to do? 1. Demo 2. Interactive\n> "):
         case "1":
-            react_example()
+            asyncio.run(react_example())
         case "2":
             interactive_mode()
         case _:
@@ -5,6 +5,7 @@ Main entry point for the livestream demonstration.
 
 import sys
 import os
+import importlib
 
 def show_menu():
     """Display the main menu for the livestream demo."""
@@ -20,32 +21,41 @@ def show_menu():
     print("0. Exit")
     print("-" * 50)
 
+# Examples are imported once and reused, so the LM and caches stay warm
+_MODS = {}
+
+def _get(name):
+    """Import an example module in-process (their filenames aren't valid identifiers)."""
+    if name not in _MODS:
+        _MODS[name] = importlib.import_module(f"examples.{name}")
+    return _MODS[name]
+
 def run_example(choice):
     """Run the selected example."""
-    if choice == "1":
-        print("🚀 Running Gemini API Basics...")
-        os.system("uv run python examples/01_gemini_basics.py")
-    elif choice == "2":
-        print("🚀 Running DSPy Introduction...")
-        os.system("uv run python examples/02_dspy_intro.py")
-    elif choice == "3":
-        print("🚀 Running Simple Agent Demo...")
-        # Run the simple demo mode (option 1)
-        os.system("echo '1' | uv run python examples/03_simple_agent.py")
-    elif choice == "4":
-        print("🚀 Running Verbose Agent Demo...")
-        # Run the verbose demo mode (option 2)
-        os.system("echo '2' | uv run python examples/03_simple_agent.py")
-    elif choice == "5":
-        print("🚀 Starting Interactive Agent...")
-        # Run the interactive mode (option 3)
-        os.system("echo '3' | uv run python examples/03_simple_agent.py")
-    elif choice == "6":
-        print("🚀 Starting Verbose Interactive Mode...")
-        # Run the verbose interactive mode (option 4)
-        os.system("echo '4' | uv run python examples/03_simple_agent.py")
-    else:
-        print("❌ Invalid choice. Please try again.")
+    # A failing example (missing key, network error, Ctrl+C) shouldn't end the session
+    try:
+        if choice == "1":
+            print("🚀 Running Gemini API Basics...")
+            _get("01_gemini_basics").main()
+        elif choice == "2":
+            print("🚀 Running DSPy Introduction...")
+            _get("02_dspy_intro").main()
+        elif choice == "3":
+            print("🚀 Running Simple Agent Demo...")
+            _get("03_simple_agent").demo_agent(verbose=False)
+        elif choice == "4":
+            print("🚀 Running Verbose Agent Demo...")
+            _get("03_simple_agent").demo_agent(verbose=True)
+        elif choice == "5":
+            print("🚀 Starting Interactive Agent...")
+            _get("03_simple_agent").interactive_mode(verbose=False)
+        elif choice == "6":
+            print("🚀 Starting Verbose Interactive Mode...")
+            _get("03_simple_agent").interactive_mode(verbose=True)
+        else:
+            print("❌ Invalid choice. Please try again.")
+    except (Exception, KeyboardInterrupt) as e:
+        print(f"\n❌ Example stopped: {type(e).__name__}: {e}")
 
 def check_setup():
     """Check if the environment is properly set up."""